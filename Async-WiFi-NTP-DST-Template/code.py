@@ -18,9 +18,56 @@ import asyncio       # Asynchronous programming library for tasks
 import rtc           # For the internal RTC
 import time          # Ensure time functions are available
 
+try:
+    from micropython import const  # Compile-time constants (inlined into the bytecode on CircuitPython)
+except ImportError:
+    const = lambda x: x  # Fallback so the file can still be imported by regular Python (e.g. for testing)
+
+################################################################################
+#  Constants
+################################################################################
+
+# Timing values (in seconds). Names starting with an underscore are inlined by const()
+# and do not take up space in the module's globals on CircuitPython.
+_SECONDS_PER_HOUR = const(3600)   # Used to convert hour offsets to seconds
+_WIFI_RETRY_DELAY = const(10)     # Initial delay between Wi-Fi reconnection attempts
+_WIFI_RETRY_MAX_DELAY = const(300) # Longest delay between Wi-Fi reconnection attempts (the delay doubles after each failure)
+_WIFI_CHECK_INTERVAL = const(300) # Fallback interval for checking Wi-Fi when no task reports a failure
+_NTP_RETRY_DELAY = const(1)       # Initial delay between NTP sync retries (doubles after each failure, up to NTP_SYNC_INTERVAL)
+
+# Log tags and fixed log messages shared across call sites (const() only accepts integers,
+# so these are plain module-level strings, defined once instead of repeated as literals)
+_TAG_WIFI = "wifi_connect"
+_TAG_NTP = "ntp_sync"
+_TAG_MEMORY = "memory_status"
+_TAG_MAIN = "main_error"
+_LOG_NTP_FETCH = "NTP: Fetching time..."
+
 ################################################################################
 #  Configuration Class
 ################################################################################
+
+def _getbool(key, default=False):
+    """
+    Reads a "true"/"false" setting from settings.toml (case-insensitive) and returns it
+    as a boolean. Returns the default if the setting is missing, without building a
+    temporary default string to lowercase and compare.
+    """
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return value.lower() == "true"
+
+def _getint(key, default):
+    """
+    Reads a numeric setting from settings.toml (stored either as a number or as a
+    quoted string) and returns it as an integer, or the default if the setting is missing.
+    """
+    value = os.getenv(key)
+    if value is None:
+        return default
+    return int(value)
+
 class Config:
     """
     The Config class reads environment variables from settings.toml and stores them
@@ -28,11 +75,14 @@ class Config:
     """
     
     # Network & Logging Flags (convert strings to booleans)
-    WIFI_ENABLED = os.getenv("WIFI_ENABLED", "false").lower() == "true" # Enable or disable Wi-Fi (disabled by default if unset)
-    NTP_ENABLED = os.getenv("NTP_ENABLED", "false").lower() == "true" # Enable or disable NTP support (disabled by default if unset)
-    SYSLOG_SERVER_ENABLED = os.getenv("SYSLOG_SERVER_ENABLED", "false").lower() == "true" # Enable or disable syslog (disabled by default if unset)
-    MEMORY_MONITORING = os.getenv("MEMORY_MONITORING", "false").lower() == "true" # Enable or disable memory monitoring (disabled by default if unset)
-    CONSOLE_LOG_ENABLED = os.getenv("CONSOLE_LOG_ENABLED", "false").lower() == "true" # Enable or disable console logging (disabled by default if unset)
+    WIFI_ENABLED = _getbool("WIFI_ENABLED") # Enable or disable Wi-Fi (disabled by default if unset)
+    NTP_ENABLED = _getbool("NTP_ENABLED") # Enable or disable NTP support (disabled by default if unset)
+    SYSLOG_SERVER_ENABLED = _getbool("SYSLOG_SERVER_ENABLED") # Enable or disable syslog (disabled by default if unset)
+    MEMORY_MONITORING = _getbool("MEMORY_MONITORING") # Enable or disable memory monitoring (disabled by default if unset)
+    MEMORY_MONITORING_INTERVAL = _getint("MEMORY_MONITORING_INTERVAL", 300) # Interval (in seconds) between periodic memory usage logs
+    MEMORY_MONITORING_FORCE_GC = _getbool("MEMORY_MONITORING_FORCE_GC") # Run gc.collect() before each memory reading (disabled by default if unset)
+    MANUAL_GC_ENABLED = _getbool("MANUAL_GC_ENABLED") # Disable automatic garbage collection and only collect at task checkpoints (disabled by default if unset)
+    CONSOLE_LOG_ENABLED = _getbool("CONSOLE_LOG_ENABLED") # Enable or disable console logging (disabled by default if unset)
     DEVICE_HOSTNAME = os.getenv("DEVICE_HOSTNAME", "") # Device hostname (currently only used for syslog functionality, but possibly more in the future)
 
     # WiFi Configuration: SSID and PSK for connecting to a Wi-Fi network
@@ -41,20 +91,20 @@ class Config:
 
     # Syslog Configuration: Remote server details for syslog logging (if used) - Note: Only usyslog-circuitpython is currently supported by this framework
     SYSLOG_SERVER = os.getenv("SYSLOG_SERVER", "") # Syslog server target (URL or IP)
-    SYSLOG_PORT = int(os.getenv("SYSLOG_PORT", 514)) # Syslog server port
-    SYSLOG_TIMESTAMP_ENABLED = os.getenv("SYSLOG_TIMESTAMP_ENABLED", "true").lower() == "true" # Syslog timestamp enabled
+    SYSLOG_PORT = _getint("SYSLOG_PORT", 514) # Syslog server port
+    SYSLOG_TIMESTAMP_ENABLED = _getbool("SYSLOG_TIMESTAMP_ENABLED", True) # Syslog timestamp enabled
 
     # NTP Configuration: Parameters to synchronize time from an NTP server
     DEFAULT_NTP_OFFSET = -8 # Default timezone offset (in hours)
     DEFAULT_NTP_SYNC_INTERVAL = 3600 # Default NTP sync interval (in seconds) to resync time
-    NTP_OFFSET = int(os.getenv("NTP_OFFSET", DEFAULT_NTP_OFFSET))    # Timezone offset (in hours)
-    NTP_SYNC_INTERVAL = int(os.getenv("NTP_SYNC_INTERVAL", DEFAULT_NTP_SYNC_INTERVAL))  # NTP sync interval (in seconds) to resync time
+    NTP_OFFSET = _getint("NTP_OFFSET", DEFAULT_NTP_OFFSET)    # Timezone offset (in hours)
+    NTP_SYNC_INTERVAL = _getint("NTP_SYNC_INTERVAL", DEFAULT_NTP_SYNC_INTERVAL)  # NTP sync interval (in seconds) to resync time
     NTP_SERVER = os.getenv("NTP_SERVER", "")  # NTP server address - if empty, the NTP library default is used
 
     # DST (Daylight Savings Time) Configuration: Controls how DST adjustments are applied
-    DST_ENABLED = os.getenv("DST_ENABLED", "false").lower() == "true"
+    DST_ENABLED = _getbool("DST_ENABLED")
     DST_MODE = os.getenv("DST_MODE", "dynamic")  # "dynamic" uses computed boundaries (US); "static" uses provided dates (non-US)
-    DST_OFFSET = int(os.getenv("DST_OFFSET", 1))   # Additional offset during DST (typically +1 hour)
+    DST_OFFSET = _getint("DST_OFFSET", 1)   # Additional offset during DST (typically +1 hour)
     DST_START = os.getenv("DST_START", "03-14 02:00")  # Static DST start time (used if DST_MODE is "static")
     DST_END = os.getenv("DST_END", "11-07 02:00")    # Static DST end time (used if DST_MODE is "static")
 
@@ -65,156 +115,227 @@ class Config:
 # Global variable for a syslog client (if syslog is enabled and configured)
 syslog_client = None  
 
-def structured_log(message, level=6, tag=None):
+def _noop(*args, **kwargs):
     """
-    Logs a message to the console (if enabled via configuration) and optionally
-    sends the message to a remote Syslog server if a syslog client is set up.
+    Does nothing. Bound in place of the logging and memory monitoring functions
+    when they are disabled, so callers skip the work without checking a flag.
+    """
+    pass
+
+
+def _send_syslog(level, message, tag):
+    """
+    Sends a message to the remote Syslog server once the syslog client is set up.
     """
-    # Log to console if enabled.
-    if Config.CONSOLE_LOG_ENABLED:
-        print(message)
-    
-    # If a syslog client is available, try to send the message.
     if syslog_client:
         try:
             syslog_client.log(level, message, tag)
-        except RuntimeError:
-            pass  # Ignore errors due to transient network issues
+        except (RuntimeError, OSError):
+            # Ignore errors due to transient network issues, but ask the Wi-Fi task
+            # to check the connection now (wifi_event is defined in the Wi-Fi section)
+            wifi_event.set()
+
+# The structured_log() variants below log a message to the console, to the remote Syslog
+# server, or to both. Only one of them is used, chosen at startup from the configuration,
+# so no per-call flag checks are needed. If args are given, message is treated as a
+# %-format template and is only formatted here, so callers never build strings for
+# disabled log output.
+
+def _log_console(message, *args, level=6, tag=None):
+    """
+    structured_log() variant that logs to the console only.
+    """
+    if args:
+        message = message % args
+    print(message)
 
+def _log_syslog(message, *args, level=6, tag=None):
+    """
+    structured_log() variant that logs to the remote Syslog server only.
+    """
+    if args:
+        message = message % args
+    _send_syslog(level, message, tag)
 
-def monitor_memory(mem_tag=""):
+def _log_both(message, *args, level=6, tag=None):
+    """
+    structured_log() variant that logs to both the console and the remote Syslog server.
+    """
+    if args:
+        message = message % args
+    print(message)
+    _send_syslog(level, message, tag)
+
+
+# Template for the memory usage log line (formatted in a single pass by structured_log).
+# Percentages are whole numbers so no floating-point math or formatting is needed.
+_MEM_FMT = "[Memory] %s - Free=%d (%d%%), Used=%d (%d%%), Total=%d"
+
+def _monitor_memory(mem_tag=""):
     """
     Logs current memory usage information. This can be useful to diagnose
     memory-related issues on resource-constrained devices.
     """
-    if Config.MEMORY_MONITORING:
-        gc.collect()  # Trigger garbage collection to free up memory
-        free_mem = gc.mem_free()      # Get amount of free memory
-        used_mem = gc.mem_alloc()     # Get amount of allocated memory
-        total_mem = free_mem + used_mem
-        free_pct = (100 * free_mem / total_mem) if total_mem > 0 else 0
-        used_pct = (100 * used_mem / total_mem) if total_mem > 0 else 0
+    # Optionally trigger garbage collection first. This gives more accurate numbers
+    # (uncollected garbage otherwise counts as used memory) at the cost of a
+    # blocking pause in the event loop on every call.
+    if Config.MEMORY_MONITORING_FORCE_GC:
+        gc.collect()
+    free_mem = gc.mem_free()      # Get amount of free memory
+    used_mem = gc.mem_alloc()     # Get amount of allocated memory
+    # The total is read on every sample because the heap can grow at runtime (e.g. CircuitPython 9.x)
+    total_mem = free_mem + used_mem
+    # Integer percentages (avoids float work, which is slow on boards without an FPU)
+    free_pct = (100 * free_mem // total_mem) if total_mem > 0 else 0
+    used_pct = (100 * used_mem // total_mem) if total_mem > 0 else 0
+
+    # Log a detailed memory usage message
+    structured_log(_MEM_FMT, mem_tag, free_mem, free_pct, used_mem, used_pct, total_mem, tag=_TAG_MEMORY)
+
+# Choose the logging and memory monitoring implementations once at startup. If a
+# feature is disabled, its name is bound to _noop so calls cost as little as possible.
+# (Syslog output is only possible when both Wi-Fi and syslog are enabled.)
+_syslog_enabled = Config.WIFI_ENABLED and Config.SYSLOG_SERVER_ENABLED
+if Config.CONSOLE_LOG_ENABLED and _syslog_enabled:
+    structured_log = _log_both
+elif Config.CONSOLE_LOG_ENABLED:
+    structured_log = _log_console
+elif _syslog_enabled:
+    structured_log = _log_syslog
+else:
+    structured_log = _noop
+
+monitor_memory = _monitor_memory if Config.MEMORY_MONITORING else _noop
 
-        # Build a detailed memory usage log message
-        structured_log("[Memory] " + mem_tag + " - Free=" + str(free_mem) + " (" + "{:.2f}".format(free_pct) + "%), Used=" + str(used_mem) + " (" + "{:.2f}".format(used_pct) + "%), Total=" + str(total_mem), tag="memory_status")
+# Garbage collection checkpoint called by each task at the end of a cycle, a point where
+# a short pause is harmless. With MANUAL_GC_ENABLED, automatic collection is disabled in
+# main() and these checkpoints are the only place garbage is collected; otherwise they do nothing.
+gc_checkpoint = gc.collect if Config.MANUAL_GC_ENABLED else _noop
 
 ################################################################################
 #  Conditional Wi-Fi Setup
 ################################################################################
 
 if Config.WIFI_ENABLED:
-    import wifi            # CircuitPython Wi-Fi library
-    import socketpool      # Provides a socket pool for network operations
-
-    # Create a socket pool using the current Wi-Fi radio
-    pool = socketpool.SocketPool(wifi.radio)
-
-    # Conditionally import and initialize usyslog client
-    if Config.SYSLOG_SERVER_ENABLED:
-        import usyslog
-
-        # Instantiate syslog client using socketpool and Config values
-        syslog_client = usyslog.UDPClient(
-            pool=pool, # Use the previously-created pool
-            ip=Config.SYSLOG_SERVER, # Desired server (set in settings.toml file)
-            port=Config.SYSLOG_PORT, # Desired port (set in settings.toml file)
-            tag=None,  # Tag for better RFC compliance where the default tag is None, but can be overridden in each log call
-            hostname=Config.DEVICE_HOSTNAME if Config.DEVICE_HOSTNAME else None, # Hostname for better RFC compliance (set in settings.toml if desired)
-            include_timestamp=Config.SYSLOG_TIMESTAMP_ENABLED # Timestamp enable/disable for better RFC compliance (set in settings.toml if desired)
-        )
-
-    def wifi_connect_sync():
-        """
-        Attempts to connect to the Wi-Fi network using credentials provided in Config.
-        This is a one-time synchronous attempt.
-        """
-        if not wifi.radio.connected:
+    # Guard the radio imports so the template still runs on boards without Wi-Fi support
+    try:
+        import wifi            # CircuitPython Wi-Fi library
+        import socketpool      # Provides a socket pool for network operations
+    except ImportError as e:
+        structured_log("Wi-Fi: Libraries unavailable, disabling Wi-Fi: %s", e, tag=_TAG_WIFI)
+        Config.WIFI_ENABLED = False
+
+# Global socket pool for network operations (created in _bootstrap() if Wi-Fi is enabled)
+pool = None
+
+# Event set by other tasks (NTP sync, syslog sends) when a network operation fails, waking
+# wifi_connect_task() to check the connection right away instead of waiting for its next periodic check
+wifi_event = asyncio.Event()
+
+def wifi_connect_sync():
+    """
+    Attempts to connect to the Wi-Fi network using credentials provided in Config.
+    This is a one-time synchronous attempt. Does nothing if Wi-Fi is disabled.
+    """
+    if not Config.WIFI_ENABLED:
+        return
+
+    if not wifi.radio.connected:
+        try:
+            wifi.radio.connect(Config.SSID, Config.PSK)
+            structured_log("Wi-Fi connected: %s", wifi.radio.ipv4_address, tag=_TAG_WIFI)
+        except ConnectionError as e:
+            structured_log("Wi-Fi connection failed: %s", e, tag=_TAG_WIFI)
+
+async def wifi_connect_task():
+    """
+    Asynchronous task that checks Wi-Fi connectivity whenever wifi_event is set (or
+    every _WIFI_CHECK_INTERVAL seconds otherwise). If the device becomes disconnected,
+    it attempts to reconnect, backing off exponentially from _WIFI_RETRY_DELAY up to
+    _WIFI_RETRY_MAX_DELAY seconds while the network stays unavailable.
+    Returns immediately if Wi-Fi is disabled.
+    """
+    if not Config.WIFI_ENABLED:
+        return
+
+    # Bind the helpers and settings used in the loop to locals once. Local lookups are
+    # faster than global and attribute lookups, so the other tasks do the same.
+    log, sleep, wait_for = structured_log, asyncio.sleep, asyncio.wait_for
+    checkpoint, event, radio = gc_checkpoint, wifi_event, wifi.radio
+    ssid, psk = Config.SSID, Config.PSK
+
+    # Current delay before the next reconnection attempt
+    retry_delay = _WIFI_RETRY_DELAY
+
+    while True:
+        if not radio.connected:
             try:
-                wifi.radio.connect(Config.SSID, Config.PSK)
-                structured_log("Wi-Fi connected: " + str(wifi.radio.ipv4_address), tag="wifi_connect")
+                radio.connect(ssid, psk)
+                log("Wi-Fi reconnected: %s", radio.ipv4_address, tag=_TAG_WIFI)
+                retry_delay = _WIFI_RETRY_DELAY  # Start over with a short delay after the next drop
             except ConnectionError as e:
-                structured_log("Wi-Fi connection failed: " + str(e), tag="wifi_connect")
-
-    async def wifi_connect_task():
-        """
-        Asynchronous task that continuously checks Wi-Fi connectivity.
-        If the device becomes disconnected, it attempts to reconnect every 10 seconds.
-        """
-        while True:
-            if not wifi.radio.connected:
-                try:
-                    wifi.radio.connect(Config.SSID, Config.PSK)
-                    structured_log("Wi-Fi reconnected: " + str(wifi.radio.ipv4_address), tag="wifi_connect")
-                except ConnectionError as e:
-                    structured_log("Wi-Fi reconnection failed: " + str(e), tag="wifi_connect")
-                    monitor_memory("During Wi-Fi reconnect")
-                    await asyncio.sleep(10)  # Wait 10 seconds before trying again
-            else:
-                await asyncio.sleep(60)  # Check connectivity every 60 seconds
-else:
-    # Define empty functions if Wi-Fi is disabled in the configuration
-    def wifi_connect_sync(): pass
-    async def wifi_connect_task(): pass
+                log("Wi-Fi reconnection failed: %s", e, tag=_TAG_WIFI)
+                checkpoint()
+                await sleep(retry_delay)  # Wait before trying again
+                retry_delay = min(retry_delay * 2, _WIFI_RETRY_MAX_DELAY)
+        else:
+            # Sleep until another task reports a network failure, with a periodic check as a fallback
+            checkpoint()
+            try:
+                await wait_for(event.wait(), _WIFI_CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            event.clear()
 
 ################################################################################
 #  Conditional NTP Setup with Hybrid DST (US & Non-US) and Configurable Server
 ################################################################################
 
-# Global flag to track if time synchronization was successful
-time_synced = False  
+# Shared runtime state. Tasks update entries in place (no `global` statement needed),
+# and any task can bind `state` to a local once to read it cheaply.
+# time_synced: whether time synchronization has succeeded at least once
+state = {"time_synced": False}
+
+def adjust_utc_time(utc_epoch, offset):
+    """
+    Adjusts a given UTC time (in seconds since the epoch) by a specified offset (in hours).
+    The offset is applied directly to the seconds, and localtime() converts the result
+    to a normalized struct_time (handling day rollovers, etc.).
+    """
+    return time.localtime(utc_epoch + offset * _SECONDS_PER_HOUR)
 
 # Check if DST adjustments are enabled in the configuration
 if Config.DST_ENABLED:
 
-    def adjust_utc_time(utc_time, offset):
-        """
-        Adjusts a given UTC time (struct_time) by a specified offset (in hours).
-        This function creates a new time tuple with the hour modified by the offset,
-        then uses mktime() and localtime() to correctly normalize the time (handling day rollovers, etc.).
-        """
-        adjusted = (
-            utc_time.tm_year,
-            utc_time.tm_mon,
-            utc_time.tm_mday,
-            utc_time.tm_hour + offset,  # Apply the hour offset here
-            utc_time.tm_min,
-            utc_time.tm_sec,
-            utc_time.tm_wday,
-            utc_time.tm_yday,
-            utc_time.tm_isdst
-        )
-        # mktime converts the tuple to seconds since the epoch; localtime converts back to a normalized struct_time
-        return time.localtime(time.mktime(adjusted))
-
-    def weekday(year, month, day):
+    def _zeller(year, month, day):
         """
         Returns the weekday (0=Monday, 6=Sunday) for a given date.
-        Uses mktime and localtime to compute the weekday.
+        Uses Zeller's congruence (pure integer math) instead of mktime/localtime.
         """
-        return time.localtime(time.mktime((year, month, day, 0, 0, 0, 0, 0, -1))).tm_wday
+        # Zeller's congruence treats January and February as months 13 and 14 of the previous year
+        if month < 3:
+            month += 12
+            year -= 1
+        k = year % 100   # Year of the century
+        j = year // 100  # Zero-based century
+        h = (day + (13 * (month + 1)) // 5 + k + k // 4 + j // 4 + 5 * j) % 7
+        # Zeller returns 0=Saturday, so shift it to 0=Monday to match struct_time.tm_wday
+        return (h + 5) % 7
 
     def nth_weekday(year, month, weekday_target, n):
         """
         Computes the day number (date) of the nth occurrence of a specified weekday in a month.
         For example, to find the second Sunday in March (weekday_target=6, n=2).
         """
-        count = 0
-        for day in range(1, 32):  # Loop through possible days (1 to 31)
-            try:
-                if weekday(year, month, day) == weekday_target:
-                    count += 1
-                    if count == n:
-                        return day
-            except Exception:
-                break  # Break the loop if an invalid date is reached
-        return None
+        # Find the first occurrence from the weekday of the 1st, then step forward whole weeks
+        return 1 + (weekday_target - _zeller(year, month, 1)) % 7 + 7 * (n - 1)
 
     def get_dynamic_dst_bounds(year):
         """
         Calculates DST boundaries dynamically based on U.S. rules:
           - DST starts on the second Sunday in March at 2:00 AM.
           - DST ends on the first Sunday in November at 2:00 AM.
-        Returns a tuple of two struct_time objects representing the start and end times.
+        Returns a tuple of two integers (seconds since the epoch) representing the start and end times.
         """
         dst_start_day = nth_weekday(year, 3, 6, 2)  # Second Sunday in March (weekday 6 = Sunday)
         dst_end_day   = nth_weekday(year, 11, 6, 1)  # First Sunday in November
@@ -222,124 +343,172 @@ if Config.DST_ENABLED:
         # Create tuples representing the DST start and end times
         dst_start_tuple = (year, 3, dst_start_day, 2, 0, 0, 0, 0, -1)
         dst_end_tuple   = (year, 11, dst_end_day, 2, 0, 0, 0, 0, -1)
-        # Normalize these times to ensure correctness
-        dst_start = time.localtime(time.mktime(dst_start_tuple))
-        dst_end   = time.localtime(time.mktime(dst_end_tuple))
-        return dst_start, dst_end
+        # Convert to seconds since the epoch so they can be compared as plain integers
+        return time.mktime(dst_start_tuple), time.mktime(dst_end_tuple)
 
-    def parse_static_dst_time(dst_str, year):
+    def parse_static_dst_time(dst_str):
         """
-        Parses a DST time string in the format 'MM-DD HH:MM' and returns a tuple
-        representing that time for a specific year.
+        Parses a DST time string in the format 'MM-DD HH:MM' and returns a
+        (month, day, hour, minute) tuple that applies to any year.
         This is used when DST_MODE is set to "static".
         """
         month_day, hm = dst_str.split(" ")
         month, day = map(int, month_day.split("-"))
         hour, minute = map(int, hm.split(":"))
-        return (year, month, day, hour, minute, 0, 0, 0, -1)
+        return (month, day, hour, minute)
+
+    # Cache of DST boundaries keyed by year, so they are only computed once per year
+    _dst_cache = {}
 
-    def is_dst(utc_time):
+    # Resolve the DST mode once at startup rather than on every call to is_dst_epoch()
+    _DST_DYNAMIC = Config.DST_MODE.lower() == "dynamic"
+
+    # In static mode, parse the configured DST start and end times once at startup
+    if not _DST_DYNAMIC:
+        _DST_START_MD = parse_static_dst_time(Config.DST_START)
+        _DST_END_MD = parse_static_dst_time(Config.DST_END)
+
+    def is_dst_epoch(utc_epoch):
         """
-        Determines whether Daylight Savings Time (DST) is in effect.
-        It converts the provided UTC time to local standard time by applying the base NTP_OFFSET,
-        then checks whether that local time falls within the DST period, either computed dynamically
-        or parsed from static configuration values.
+        Determines whether Daylight Savings Time (DST) is in effect for a UTC time given
+        in seconds since the epoch. It converts that time to local standard time by applying
+        the base NTP_OFFSET, then checks whether that local time falls within the DST period,
+        either computed dynamically or parsed from static configuration values.
         """
-        # Convert raw UTC to local standard time using the base offset from Config
-        local_standard = adjust_utc_time(utc_time, Config.NTP_OFFSET)
-        year = local_standard.tm_year
-
-        # Choose DST calculation method based on the DST_MODE setting
-        if Config.DST_MODE.lower() == "dynamic":
-            dst_start, dst_end = get_dynamic_dst_bounds(year)
-        else:
-            # Parse static DST start and end times from configuration
-            dst_start = time.localtime(time.mktime(parse_static_dst_time(Config.DST_START, year)))
-            dst_end   = time.localtime(time.mktime(parse_static_dst_time(Config.DST_END, year)))
+        # Convert raw UTC to local standard time (in seconds) using the base offset from Config
+        local_standard = utc_epoch + Config.NTP_OFFSET * _SECONDS_PER_HOUR
+        year = time.localtime(local_standard).tm_year
+
+        # Reuse the DST boundaries for this year if they were already computed
+        bounds = _dst_cache.get(year)
+        if bounds is None:
+            # Choose DST calculation method based on the DST_MODE setting
+            if _DST_DYNAMIC:
+                bounds = get_dynamic_dst_bounds(year)
+            else:
+                # Apply the pre-parsed static DST start and end times to this year
+                bounds = (time.mktime((year,) + _DST_START_MD + (0, 0, 0, -1)),
+                          time.mktime((year,) + _DST_END_MD + (0, 0, 0, -1)))
+            # Keep the cache small (only the current and possibly the previous/next year are needed)
+            if len(_dst_cache) >= 2:
+                _dst_cache.clear()
+            _dst_cache[year] = bounds
+        dst_start, dst_end = bounds
         # Return True if the current local standard time is within the DST period
         return dst_start <= local_standard < dst_end
 else:
     # If DST adjustments are disabled, this function always returns False
-    def is_dst(utc_time):
+    def is_dst_epoch(utc_epoch):
         return False
 
-# Set up the NTP section only if NTP is enabled in the configuration
-if Config.NTP_ENABLED:
-    import adafruit_ntp   # Library to handle NTP synchronization
+# Global NTP client (created in _bootstrap() if NTP is enabled)
+ntp_client = None
 
-    async def ntp_time_sync_task():
-        """
-        Periodically fetches the current time from an NTP server and adjusts it based on
-        the configured time zone and DST settings. The adjusted local time is then logged.
-        """
-        global time_synced
+async def ntp_time_sync_task():
+    """
+    Periodically fetches the current time from an NTP server and adjusts it based on
+    the configured time zone and DST settings. The adjusted local time is then logged.
+    Returns immediately if NTP is disabled.
+    """
+    # Nothing to do if NTP is disabled or the client could not be created in _bootstrap()
+    if not Config.NTP_ENABLED or ntp_client is None:
+        return
+
+    ntp = ntp_client
+    r = rtc.RTC()  # Prepare an RTC object for setting system time
+
+    # Bind the helpers and configuration values used in the loop to locals once
+    log, sleep, checkpoint = structured_log, asyncio.sleep, gc_checkpoint
+    event, st = wifi_event, state
+    ntp_offset = Config.NTP_OFFSET
+    dst_offset = Config.DST_OFFSET
+    interval = Config.NTP_SYNC_INTERVAL
 
-        structured_log("NTP: Initializing client...", tag="ntp_sync")
+    # Delay before retrying after a failed sync. It starts short so the first sync
+    # completes quickly at boot (e.g. while Wi-Fi is still coming up), then doubles
+    # on each consecutive failure up to the normal sync interval.
+    retry_delay = _NTP_RETRY_DELAY
+
+    # Enter a loop to periodically sync time.
+    while True:
+        synced = False
         try:
-            # Initialize the NTP client using a raw UTC mode (tz_offset=0)
-            # If a custom NTP_SERVER is specified in the configuration, use it instead of the default
-            if Config.NTP_SERVER:
-                ntp = adafruit_ntp.NTP(pool, server=Config.NTP_SERVER, tz_offset=0)
+            log(_LOG_NTP_FETCH, tag=_TAG_NTP)
+            # Retrieve raw UTC time from the NTP server
+            utc_time = ntp.datetime
+
+            # Convert the raw UTC time to seconds since the epoch once, for both the DST check and the adjustment.
+            # This also validates the response: mktime() raises TypeError if it is missing or has empty (None) fields,
+            # and OverflowError/ValueError if a field is out of range (e.g. a bogus year).
+            try:
+                utc_epoch = time.mktime(utc_time)
+            except (TypeError, OverflowError, ValueError):
+                utc_epoch = None
+
+            if utc_epoch is None:
+                log("NTP: Invalid response received.", tag=_TAG_NTP)
             else:
-                ntp = adafruit_ntp.NTP(pool, tz_offset=0)
-            structured_log("NTP: Client initialized.", tag="ntp_sync")
-        except Exception as e:
-            # Log any errors that occur during NTP client creation
-            structured_log("NTP: Error creating client: " + str(e), tag="ntp_sync")
-            return
+                # Start with the base timezone offset
+                effective_offset = ntp_offset
+                # Add the DST offset if DST is determined to be active
+                if is_dst_epoch(utc_epoch):
+                    effective_offset += dst_offset
+
+                # Adjust the raw UTC time by the effective offset to obtain local time
+                local_time = adjust_utc_time(utc_epoch, effective_offset)
+
+                # Log the synchronized local time and the effective offset used
+                # (the time fields are passed as deferred arguments, so the whole line is formatted in one call)
+                log(
+                    "NTP: Time synced successfully: %d-%02d-%02d %02d:%02d:%02d (UTC offset: %d)",
+                    local_time.tm_year,
+                    local_time.tm_mon,
+                    local_time.tm_mday,
+                    local_time.tm_hour,
+                    local_time.tm_min,
+                    local_time.tm_sec,
+                    effective_offset,
+                    tag=_TAG_NTP
+                )
+                # Record that time synchronization was successful
+                st["time_synced"] = True
+                synced = True
+                # Set the RTC so time.localtime() is actually correct
+                r.datetime = local_time  # local_time is a time.struct_time
+
+        except OSError as e:
+            # Log network errors (timeouts, DNS failures, etc.) encountered during time synchronization
+            log("NTP: Error syncing time: %s", e, tag=_TAG_NTP)
+            # Ask the Wi-Fi task to check the connection now
+            event.set()
+
+        checkpoint()
+        if synced:
+            # Wait for the configured sync interval before syncing again
+            retry_delay = _NTP_RETRY_DELAY
+            await sleep(interval)
+        else:
+            # Back off exponentially before retrying a failed sync
+            await sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, interval)
 
-        r = rtc.RTC()  # Prepare an RTC object for setting system time
+################################################################################
+#  Memory Sampler Task
+################################################################################
 
-        # Enter a loop to periodically sync time.
-        while True:
-            try:
-                structured_log("NTP: Fetching time...", tag="ntp_sync")
-                # Retrieve raw UTC time from the NTP server
-                utc_time = ntp.datetime
-
-                # Check for valid time data
-                if utc_time is None or None in [utc_time.tm_year, utc_time.tm_mon, utc_time.tm_mday,
-                                                 utc_time.tm_hour, utc_time.tm_min, utc_time.tm_sec]:
-                    structured_log("NTP: Invalid response received: " + str(utc_time), tag="ntp_sync")
-                else:
-                    # Start with the base timezone offset
-                    effective_offset = Config.NTP_OFFSET
-                    # Add the DST offset if DST is determined to be active
-                    if is_dst(utc_time):
-                        effective_offset += Config.DST_OFFSET
-
-                    # Adjust the raw UTC time by the effective offset to obtain local time
-                    local_time = adjust_utc_time(utc_time, effective_offset)
-
-                    # Format the local time as a string using .format() for compatibility
-                    formatted_time = "{}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}".format(
-                        local_time.tm_year,
-                        local_time.tm_mon,
-                        local_time.tm_mday,
-                        local_time.tm_hour,
-                        local_time.tm_min,
-                        local_time.tm_sec
-                    )
-                    # Log the synchronized local time and the effective offset used
-                    structured_log("NTP: Time synced successfully: " + formatted_time + " (UTC offset: " + str(effective_offset) + ")", tag="ntp_sync")
-                    # Set time_synced to true since it was successful
-                    time_synced = True
-                    # Set the RTC so time.localtime() is actually correct
-                    r.datetime = local_time  # local_time is a time.struct_time
-
-            except Exception as e:
-                # Log any errors encountered during time synchronization
-                structured_log("NTP: Error syncing time: " + str(e), tag="ntp_sync")
-
-            # Monitor and log memory usage after each sync attempt
-            monitor_memory("After NTP sync")
-            # Wait for the configured sync interval before trying again
-            await asyncio.sleep(Config.NTP_SYNC_INTERVAL)
-else:
-    # Define a placeholder function if NTP is disabled
-    async def ntp_time_sync_task():
-        """Placeholder function when NTP is disabled to avoid syntax errors."""
-        return
+async def memory_sampler_task():
+    """
+    Periodically logs memory usage every MEMORY_MONITORING_INTERVAL seconds.
+    This is the only periodic memory reading, giving a steady low-frequency view of
+    memory over time without adding readings to other tasks or error paths.
+    """
+    # Bind the helpers used in the loop to locals once
+    mem, sleep, checkpoint = monitor_memory, asyncio.sleep, gc_checkpoint
+    interval = Config.MEMORY_MONITORING_INTERVAL
+    while True:
+        mem("Periodic")
+        checkpoint()
+        await sleep(interval)
 
 ################################################################################
 #  Example Dummy Task
@@ -347,50 +516,119 @@ else:
 
 async def dummy_task():
     """
-    A simple asynchronous task that logs a message and memory stats every 10 seconds.
+    A simple asynchronous task that logs a message every 10 seconds.
     This is useful for testing and ensuring the event loop remains active.
+    (Memory usage is logged separately by memory_sampler_task().)
     """
+    # Bind the helpers used in the loop to locals once
+    log, sleep, checkpoint = structured_log, asyncio.sleep, gc_checkpoint
     while True:
-        structured_log("Hello from dummy_task!", tag="dummy_task")
-        monitor_memory("dummy_task")
-        await asyncio.sleep(10)
+        log("Hello from dummy_task!", tag="dummy_task")
+        checkpoint()  # gc_checkpoint(): collect garbage once per cycle (only does anything if MANUAL_GC_ENABLED is set)
+        await sleep(10)
 
 ################################################################################
-#  main() - Gather & Run Tasks
+#  main() - Start & Run Tasks
 ################################################################################
 
+def _bootstrap():
+    """
+    Creates the long-lived objects (socket pool, syslog client and NTP client) together,
+    before any task starts or anything is logged, so they are not interleaved on the heap
+    with short-lived allocations. A single collection then clears the boot-time garbage.
+    The optional usyslog and adafruit_ntp libraries are only imported here, and only if
+    their feature is enabled, so they take no memory until they are actually needed.
+    """
+    global pool, syslog_client, ntp_client
+
+    if Config.WIFI_ENABLED:
+        # Create a socket pool using the current Wi-Fi radio
+        pool = socketpool.SocketPool(wifi.radio)
+
+        # Conditionally import and initialize usyslog client
+        if Config.SYSLOG_SERVER_ENABLED:
+            import usyslog
+
+            # Instantiate syslog client using socketpool and Config values
+            syslog_client = usyslog.UDPClient(
+                pool=pool, # Use the previously-created pool
+                ip=Config.SYSLOG_SERVER, # Desired server (set in settings.toml file)
+                port=Config.SYSLOG_PORT, # Desired port (set in settings.toml file)
+                tag=None,  # Tag for better RFC compliance where the default tag is None, but can be overridden in each log call
+                hostname=Config.DEVICE_HOSTNAME if Config.DEVICE_HOSTNAME else None, # Hostname for better RFC compliance (set in settings.toml if desired)
+                include_timestamp=Config.SYSLOG_TIMESTAMP_ENABLED # Timestamp enable/disable for better RFC compliance (set in settings.toml if desired)
+            )
+
+    if Config.NTP_ENABLED:
+        try:
+            # NTP needs the socket pool, so it cannot run without Wi-Fi
+            if pool is None:
+                raise RuntimeError("Wi-Fi is not enabled")
+            import adafruit_ntp   # Library to handle NTP synchronization
+            # Initialize the NTP client using a raw UTC mode (tz_offset=0)
+            # If a custom NTP_SERVER is specified in the configuration, use it instead of the default
+            if Config.NTP_SERVER:
+                ntp_client = adafruit_ntp.NTP(pool, server=Config.NTP_SERVER, tz_offset=0)
+            else:
+                ntp_client = adafruit_ntp.NTP(pool, tz_offset=0)
+        except Exception as e:
+            # Log any errors that occur during NTP client creation
+            structured_log("NTP: Error creating client: %s", e, tag=_TAG_NTP)
+
+    # Free the garbage left over from imports and setup before the tasks start
+    gc.collect()
+
+    # Have the collector run once a quarter of the remaining free heap has been allocated,
+    # instead of waiting until an allocation fails (gc.threshold() is not available on
+    # every build, and it does not apply when automatic collection is disabled)
+    if not Config.MANUAL_GC_ENABLED and hasattr(gc, "threshold"):
+        gc.threshold(gc.mem_free() // 4)
+
+def task_exception_handler(loop, context):
+    """
+    Event loop exception handler that logs errors from tasks which ended with an
+    unhandled exception (the tasks are not gathered, so nothing else reports them).
+    """
+    structured_log("Main task error: %s", context["exception"], tag=_TAG_MAIN)
+
 async def main():
     """
     The main coroutine that sets up and runs all enabled tasks.
-    It starts Wi-Fi, NTP, and the dummy task, then gathers them with asyncio.
+    It starts Wi-Fi, NTP, the memory sampler, and the dummy task, then keeps the event loop alive while they run.
     """
-    # Synchronously attempt Wi-Fi connection first
-    if Config.WIFI_ENABLED:
-        wifi_connect_sync()
+    # Route errors from tasks through structured_log
+    asyncio.get_event_loop().set_exception_handler(task_exception_handler)
 
-    tasks = []
+    # Create the long-lived network objects before anything else is allocated
+    _bootstrap()
 
-    # If Wi-Fi is enabled, add the asynchronous Wi-Fi monitoring task
-    if Config.WIFI_ENABLED:
-        tasks.append(asyncio.create_task(wifi_connect_task()))
-    # If NTP is enabled, add the NTP synchronization task
-    if Config.NTP_ENABLED:
-        tasks.append(asyncio.create_task(ntp_time_sync_task()))
+    # In manual GC mode, stop automatic collection so it can't pause a task at an arbitrary
+    # point; garbage is then only collected at each task's gc_checkpoint() call
+    if Config.MANUAL_GC_ENABLED:
+        gc.disable()
+
+    # Synchronously attempt Wi-Fi connection first (does nothing if Wi-Fi is disabled)
+    wifi_connect_sync()
 
-    # Always add the dummy task
-    tasks.append(asyncio.create_task(dummy_task()))
+    # Start every enabled task, collecting them in a tuple (its size is fixed, so there is
+    # no list to grow). A disabled task is listed as None and skipped.
+    tasks = tuple(asyncio.create_task(coro) for coro in (
+        wifi_connect_task() if Config.WIFI_ENABLED else None,         # Asynchronous Wi-Fi monitoring task
+        ntp_time_sync_task() if Config.NTP_ENABLED else None,         # NTP synchronization task
+        memory_sampler_task() if Config.MEMORY_MONITORING else None,  # Periodic memory sampler task
+        dummy_task(),                                                 # Always add the dummy task
+    ) if coro is not None)
 
     if tasks:
-        try:
-            # Run all tasks concurrently
-            await asyncio.gather(*tasks)
-        except Exception as e:
-            structured_log("Main task error: " + str(e), tag="main_error")
+        # The tasks are already scheduled by create_task() and run concurrently on their own,
+        # so main() just sleeps rather than building gather()'s result list and wrapper objects
+        while True:
+            await asyncio.sleep(3600)
     else:
-        structured_log("No tasks to run. Exiting...", tag="main_error")
+        structured_log("No tasks to run. Exiting...", tag=_TAG_MAIN)
 
 # Start the asyncio event loop & catch any exceptions
 try:
     asyncio.run(main())
 except Exception as e:
-    structured_log("Fatal error in asyncio loop: " + str(e), tag="main_error")
+    structured_log("Fatal error in asyncio loop: %s", e, tag=_TAG_MAIN)